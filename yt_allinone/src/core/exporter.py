@@ -22,7 +22,20 @@ def _attempt_download(url: str, timeout: float = 10.0) -> Optional[bytes]:
         return None
 
 
-def download_best_thumbnail(video_id: str, candidates: Iterable[dict] | None = None) -> Optional[str]:
+def _save_image(video_id: str, data: bytes, dest_path: Optional[str]) -> str:
+    if dest_path:
+        with open(dest_path, "wb") as fh:
+            fh.write(data)
+        return dest_path
+    fd, path = tempfile.mkstemp(prefix=f"{video_id}_", suffix=".jpg")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    return path
+
+
+def download_best_thumbnail(
+    video_id: str, candidates: Iterable[dict] | None = None, dest_path: Optional[str] = None
+) -> Optional[str]:
     """Try to download best available thumbnail for a video.
 
     Order:
@@ -31,7 +44,8 @@ def download_best_thumbnail(video_id: str, candidates: Iterable[dict] | None = N
       3) https://i.ytimg.com/vi/<id>/hqdefault.jpg
       4) Fallback to provided candidates (list of dict with 'url')
 
-    Returns path to saved temp file, or None if all attempts fail.
+    Writes to dest_path when given, otherwise to a temp file.
+    Returns the path written, or None if all attempts fail.
     """
     base = f"https://i.ytimg.com/vi/{video_id}"
     order = [
@@ -43,10 +57,7 @@ def download_best_thumbnail(video_id: str, candidates: Iterable[dict] | None = N
     for url in order:
         data = _attempt_download(url)
         if data:
-            fd, path = tempfile.mkstemp(prefix=f"{video_id}_", suffix=".jpg")
-            with os.fdopen(fd, "wb") as fh:
-                fh.write(data)
-            return path
+            return _save_image(video_id, data, dest_path)
 
     if candidates:
         for item in candidates:
@@ -55,10 +66,7 @@ def download_best_thumbnail(video_id: str, candidates: Iterable[dict] | None = N
                 continue
             data = _attempt_download(url)
             if data:
-                fd, path = tempfile.mkstemp(prefix=f"{video_id}_", suffix=".jpg")
-                with os.fdopen(fd, "wb") as fh:
-                    fh.write(data)
-                return path
+                return _save_image(video_id, data, dest_path)
 
     return None
 
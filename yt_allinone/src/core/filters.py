@@ -1,13 +1,27 @@
-from typing import Iterable, Callable, TypeVar, List, Any, Optional, Union
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar, Union
 
 T = TypeVar("T")
 
+# Matched case-insensitively. The id is not pinned to 11 chars: flat listings and
+# dry_run's URL-only check must agree on what counts.
+_SHORTS_RE = re.compile(r"/shorts/[A-Za-z0-9_-]+", re.IGNORECASE)
 
-def apply_filters(items: Iterable[T], *filters: Callable[[T], bool]) -> List[T]:
-    result: List[T] = list(items)
-    for filter_fn in filters:
-        result = [item for item in result if filter_fn(item)]
-    return result
+# Videos at or under this many seconds count as shorts
+SHORTS_MAX_DURATION = 60
+
+
+def apply_filters(items: Iterable[T], *filters: Callable[[T], bool], limit: Optional[int] = None) -> List[T]:
+    # Single pass over items; with a limit, stop as soon as enough items matched
+    if len(filters) == 1:
+        matched: Iterable[T] = filter(filters[0], items)
+    else:
+        matched = (item for item in items if all(f(item) for f in filters))
+    if limit is not None:
+        matched = islice(matched, max(0, int(limit)))
+    return list(matched)
 
 
 def _extract_url_and_duration(entry: Union[str, Any]) -> tuple[str, Optional[float]]:
@@ -38,16 +52,31 @@ def _extract_url_and_duration(entry: Union[str, Any]) -> tuple[str, Optional[flo
     return url or "", duration
 
 
+# Playlists and repeated filter passes check the same URLs again; strings are
+# immutable, so the regex result can be cached per URL
+@lru_cache(maxsize=4096)
+def is_shorts_url(url: str) -> bool:
+    # Most URLs are regular videos: reject them with a substring test before the regex.
+    # Lowercased so it stays as case-insensitive as the pattern.
+    if "/shorts/" not in url.lower():
+        return False
+    return _SHORTS_RE.search(url) is not None
+
+
 def is_shorts(entry: Union[str, Any]) -> bool:
     url, duration = _extract_url_and_duration(entry)
-    url_lower = url.lower()
-    if "/shorts/" in url_lower:
-        return True
-    if duration is not None and duration <= 60:
-        return True
-    return False
+    return is_shorts_url(url) or (duration is not None and duration <= SHORTS_MAX_DURATION)
 
 
 def is_regular(entry: Union[str, Any]) -> bool:
     return not is_shorts(entry)
 
+
+def partition(entries: Iterable[T]) -> Tuple[List[T], List[T]]:
+    # One is_shorts call per entry instead of separate is_shorts/is_regular passes
+    shorts: List[T] = []
+    regular: List[T] = []
+    for e in entries:
+        (shorts if is_shorts(e) else regular).append(e)
+    return shorts, regular
+
@@ -1,4 +1,4 @@
-from typing import Iterable, Callable, TypeVar, List
+from typing import Iterable, Callable, TypeVar, List, Dict
 
 T = TypeVar("T")
 
@@ -7,15 +7,16 @@ def select(items: Iterable[T], predicate: Callable[[T], bool]) -> List[T]:
     return [i for i in items if predicate(i)]
 
 
-def build_format_selector(quality: str) -> str:
-    q = (quality or "").strip().lower()
-    mapping = {
-        "best": "bestvideo*+bestaudio/best",
-        "1080p": "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
-        "720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
-        "480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
-    }
-    if q in mapping:
-        return mapping[q]
-    raise ValueError(f"Unsupported quality: {quality}")
+_SELECTORS: Dict[str, str] = {
+    "best": "bestvideo*+bestaudio/best",
+    "1080p": "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
+    "720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
+    "480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
+}
+
 
+def build_format_selector(quality: str) -> str:
+    try:
+        return _SELECTORS[quality.strip().lower()]
+    except (AttributeError, KeyError):
+        raise ValueError(f"Unsupported quality: {quality}") from None
@@ -1,7 +1,10 @@
+import functools
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 
 class Kind(str, Enum):
@@ -11,27 +14,70 @@ class Kind(str, Enum):
     HANDLE = "HANDLE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedInput:
     kind: Kind
     canonical_url: str
     raw: str
 
 
-_VIDEO_ID_RE = r"(?P<vid>[A-Za-z0-9_-]{11})"
-_LIST_ID_RE = r"(?P<list>[A-Za-z0-9_-]{10,})"
-_CHANNEL_ID_RE = r"(?P<chid>UC[A-Za-z0-9_-]{22})"
-_HANDLE_RE = r"(?P<handle>@[A-Za-z0-9._-]{3,30})"
+_VIDEO_ID_RE = r"[A-Za-z0-9_-]{11}"
+_LIST_ID_RE = r"[A-Za-z0-9_-]{10,}"
+_CHANNEL_ID_RE = r"UC[A-Za-z0-9_-]{22}"
+_HANDLE_RE = r"@[A-Za-z0-9._-]{3,30}"
 
 # Domains
-_YOUTUBE_HOST_RE = r"(?:www\.|m\.)?youtube\.com"
-_YOUTU_BE_HOST_RE = r"youtu\.be"
+_YOUTUBE_HOST_RE = r"(?:https?://)?(?:www\.|m\.)?youtube\.com"
+_YOUTU_BE_HOST_RE = r"(?:https?://)?youtu\.be"
+
+
+# One anchored alternation instead of up to seven sequential matches. Branches are
+# tried in order and each captures its value in a uniquely named group, so
+# m.lastgroup says which shape matched.
+_INPUT_RE = re.compile(
+    r"^(?:"
+    + "|".join(
+        [
+            rf"(?P<bare_handle>{_HANDLE_RE})",
+            rf"{_YOUTU_BE_HOST_RE}/(?P<youtu_be>{_VIDEO_ID_RE})(?:[/?#].*)?",
+            rf"{_YOUTUBE_HOST_RE}/watch\?(?:.*&)?v=(?P<watch>{_VIDEO_ID_RE})(?:[&#/].*)?",
+            rf"{_YOUTUBE_HOST_RE}/shorts/(?P<shorts>{_VIDEO_ID_RE})(?:[/?#].*)?",
+            rf"{_YOUTUBE_HOST_RE}/playlist\?(?:.*&)?list=(?P<playlist>{_LIST_ID_RE})(?:[&#/].*)?",
+            rf"{_YOUTUBE_HOST_RE}/channel/(?P<channel>{_CHANNEL_ID_RE})(?:/.*)?",
+            rf"{_YOUTUBE_HOST_RE}/(?P<handle_url>{_HANDLE_RE})(?:/videos)?(?:[/?#].*)?",
+        ]
+    )
+    + r")$",
+    re.IGNORECASE,
+)
+
+# Canonical prefix of shorts URLs; callers that care tell shorts from other VIDEOs by it
+SHORTS_URL_PREFIX = "https://www.youtube.com/shorts/"
+
+# group name -> (kind, canonical URL template, lowercase the captured value)
+_INPUT_KINDS: Dict[str, Tuple[Kind, str, bool]] = {
+    "bare_handle": (Kind.HANDLE, "https://www.youtube.com/{}/videos", True),
+    "youtu_be": (Kind.VIDEO, "https://www.youtube.com/watch?v={}", False),
+    "watch": (Kind.VIDEO, "https://www.youtube.com/watch?v={}", False),
+    # Shorts keep their own canonical URL but are still classified as VIDEO
+    "shorts": (Kind.VIDEO, SHORTS_URL_PREFIX + "{}", False),
+    "playlist": (Kind.PLAYLIST, "https://www.youtube.com/playlist?list={}", False),
+    "channel": (Kind.CHANNEL, "https://www.youtube.com/channel/{}/videos", False),
+    "handle_url": (Kind.HANDLE, "https://www.youtube.com/{}/videos", True),
+}
 
 
 def _strip(s: str) -> str:
     return s.strip()
 
 
+def _parsed(kind: Kind, canonical_url: str, raw: str) -> ParsedInput:
+    # Canonical URLs repeat heavily across a playlist; interning shares one copy of each
+    return ParsedInput(kind, sys.intern(canonical_url), raw)
+
+
+# Inputs are immutable strings and ParsedInput is frozen, so results can be shared
+@functools.lru_cache(maxsize=1024)
 def parse_input(raw: str) -> Optional[ParsedInput]:
     """Parse and canonicalize YouTube inputs.
 
@@ -41,83 +87,16 @@ def parse_input(raw: str) -> Optional[ParsedInput]:
     if not raw or not raw.strip():
         return None
 
-    s = _strip(raw)
-
-    # 1) Bare handle like @name
-    m = re.fullmatch(_HANDLE_RE, s, flags=re.IGNORECASE)
-    if m:
-        handle = m.group("handle").lower()
-        return ParsedInput(Kind.HANDLE, f"https://www.youtube.com/{handle}/videos", raw)
-
-    # Normalize to make regex matching easier
-    # youtu.be short links -> treat as url
-    # 2) youtu.be/{video}
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTU_BE_HOST_RE}/({_VIDEO_ID_RE})(?:[/?#].*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        vid = m.group("vid")
-        return ParsedInput(Kind.VIDEO, f"https://www.youtube.com/watch?v={vid}", raw)
-
-    # 3) youtube.com/watch?v=VIDEO
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTUBE_HOST_RE}/watch\?(?:.*&)?v={_VIDEO_ID_RE}(?:[&#/].*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        vid = m.group("vid")
-        return ParsedInput(Kind.VIDEO, f"https://www.youtube.com/watch?v={vid}", raw)
-
-    # 4) youtube.com/shorts/VIDEO
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTUBE_HOST_RE}/shorts/{_VIDEO_ID_RE}(?:[/?#].*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        vid = m.group("vid")
-        # Keep as shorts canonical; still classified as VIDEO
-        return ParsedInput(Kind.VIDEO, f"https://www.youtube.com/shorts/{vid}", raw)
-
-    # 5) youtube.com/playlist?list=LIST
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTUBE_HOST_RE}/playlist\?(?:.*&)?list={_LIST_ID_RE}(?:[&#/].*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        pl = m.group("list")
-        return ParsedInput(Kind.PLAYLIST, f"https://www.youtube.com/playlist?list={pl}", raw)
-
-    # 6) youtube.com/channel/UC...
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTUBE_HOST_RE}/channel/{_CHANNEL_ID_RE}(?:/.*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        chid = m.group("chid")
-        return ParsedInput(Kind.CHANNEL, f"https://www.youtube.com/channel/{chid}/videos", raw)
-
-    # 7) youtube.com/@handle (optionally with /videos)
-    m = re.match(
-        rf"^(?:https?://)?{_YOUTUBE_HOST_RE}/({_HANDLE_RE})(?:/videos)?(?:[/?#].*)?$",
-        s,
-        flags=re.IGNORECASE,
-    )
-    if m:
-        handle = m.group("handle").lower()
-        return ParsedInput(Kind.HANDLE, f"https://www.youtube.com/{handle}/videos", raw)
+    m = _INPUT_RE.match(_strip(raw))
+    if not m:
+        return None
 
-    return None
-from typing import Optional
-from urllib.parse import urlparse
+    group = m.lastgroup or ""
+    kind, template, lower = _INPUT_KINDS[group]
+    value = m.group(group)
+    return _parsed(kind, template.format(value.lower() if lower else value), raw)
 
 
 def parse_url(url: str) -> Optional[str]:
     parsed = urlparse(url)
     return parsed.netloc or None
-
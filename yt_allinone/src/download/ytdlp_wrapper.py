@@ -1,17 +1,58 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Callable
 from loguru import logger
 from yt_dlp import YoutubeDL
 
 from ..core.models import VideoEntry, DownloadError, ErrorCode
-from ..core.filters import is_shorts, is_regular
+from ..core.filters import apply_filters, is_regular, is_shorts, is_shorts_url
 from ..utils.text_utils import clean_ansi_codes
 
 
+# extract_info calls are network-bound, so enrichment runs on a small thread pool
+_ENRICH_WORKERS = 8
+
+
+def _has_shorts_url(e: VideoEntry) -> bool:
+    # Same URL rule as filters.is_shorts, so flat listings and dry_run agree
+    return is_shorts_url(e.url or e.webpage_url or "")
+
+
+def _filter_view(e: VideoEntry) -> Dict[str, Any]:
+    # Shape expected by core.filters predicates
+    return {"webpage_url": e.url, "duration": e.duration}
+
+
+def _to_entry(e: Any) -> VideoEntry:
+    # model_construct skips pydantic validation: fields come straight from yt-dlp, and
+    # enrich_entry already assigns the same fields unvalidated
+    vid = e.get("id") if hasattr(e, "get") else None
+    webpage_url = (e.get("webpage_url") if hasattr(e, "get") else None) or (
+        f"https://www.youtube.com/watch?v={vid}" if vid else None
+    )
+    return VideoEntry.model_construct(
+        id=vid or "",
+        url=webpage_url or "",
+        title=(e.get("title") if hasattr(e, "get") else None),
+        duration=(e.get("duration") if hasattr(e, "get") else None),
+        thumbnails=(e.get("thumbnails") if hasattr(e, "get") else None),
+        tags=(e.get("tags") if hasattr(e, "get") else None),
+        webpage_url=webpage_url,
+        raw=e,
+    )
+
+
 class YtDlpWrapper:
-    def __init__(self, options: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        options: Optional[Dict[str, Any]] = None,
+        ydl_factory: Optional[Callable[..., YoutubeDL]] = None,
+    ) -> None:
         self.options = options or {}
+        # Called as ydl_factory(params=...); tests pass a fake instead of patching the module
+        self._ydl = ydl_factory or YoutubeDL
 
     def _build_ydl(self, opts: Optional[Dict[str, Any]] = None) -> YoutubeDL:
         final_opts: Dict[str, Any] = {
@@ -27,7 +68,7 @@ class YtDlpWrapper:
         final_opts.update(self.options)
         if opts:
             final_opts.update(opts)
-        return YoutubeDL(params=final_opts)
+        return self._ydl(params=final_opts)
 
     def list_entries(self, url: str, cookies: Optional[str] = None, flat: bool = True) -> List[VideoEntry]:
         opts: Dict[str, Any] = {}
@@ -36,8 +77,6 @@ class YtDlpWrapper:
         if flat:
             # Use flat playlist to list quickly
             opts["extract_flat"] = True
-        entries: List[VideoEntry] = []
-        
         # Try with cookies first, then without if cookies fail
         try:
             with self._build_ydl(opts) as ydl:
@@ -62,24 +101,7 @@ class YtDlpWrapper:
         else:
             raw_entries = [info]
 
-        for e in raw_entries:
-            vid = e.get("id") if hasattr(e, "get") else None
-            webpage_url = (e.get("webpage_url") if hasattr(e, "get") else None) or (
-                f"https://www.youtube.com/watch?v={vid}" if vid else None
-            )
-            entry = VideoEntry(
-                id=vid or "",
-                url=webpage_url or "",
-                title=(e.get("title") if hasattr(e, "get") else None),
-                duration=(e.get("duration") if hasattr(e, "get") else None),
-                thumbnails=(e.get("thumbnails") if hasattr(e, "get") else None),
-                tags=(e.get("tags") if hasattr(e, "get") else None),
-                webpage_url=webpage_url,
-                raw=e,
-            )
-            entries.append(entry)
-
-        return entries
+        return list(map(_to_entry, raw_entries))
 
     def enrich_entry(self, entry: VideoEntry) -> VideoEntry:
         if entry.duration is not None and entry.title is not None:
@@ -98,6 +120,27 @@ class YtDlpWrapper:
         entry.raw = info
         return entry
 
+    def _enrich_many(
+        self, entries: Iterable[VideoEntry], skip: Optional[Callable[[VideoEntry], bool]] = None
+    ) -> Iterator[VideoEntry]:
+        """Enrich entries concurrently, yielding them in input order.
+
+        Work is submitted in batches of _ENRICH_WORKERS so a consumer that stops early
+        (islice on a limit) wastes at most one batch of extract_info calls.
+        Entries matching ``skip`` are passed through unchanged.
+        """
+
+        def one(e: VideoEntry) -> VideoEntry:
+            return e if skip is not None and skip(e) else self.enrich_entry(e)
+
+        it = iter(entries)
+        with ThreadPoolExecutor(max_workers=_ENRICH_WORKERS) as ex:
+            while True:
+                batch = list(islice(it, _ENRICH_WORKERS))
+                if not batch:
+                    return
+                yield from ex.map(one, batch)
+
     def dry_run(
         self,
         url: str,
@@ -110,11 +153,10 @@ class YtDlpWrapper:
         if filter_fn is None:
             return entries[: max(0, int(limit))] if limit is not None else entries
 
-        # Special-case optimization for shorts: prefer URL-based detection first
+        # Special-case optimization for shorts: prefer URL-based detection first.
+        # Stopping at `limit` is safe: fewer hits means every URL-based short was seen.
         if filter_fn is is_shorts:
-            url_shorts: List[VideoEntry] = [
-                e for e in entries if "/shorts/" in (e.url or e.webpage_url or "").lower()
-            ]
+            url_shorts: List[VideoEntry] = apply_filters(entries, _has_shorts_url, limit=limit)
             if limit is None:
                 # No limit requested: return only URL-based shorts without enrichment
                 return url_shorts
@@ -122,38 +164,19 @@ class YtDlpWrapper:
             if len(url_shorts) >= int(limit):
                 return url_shorts[: int(limit)]
 
-            # Need more: enrich remaining to detect duration-based shorts
-            remaining_needed = int(limit) - len(url_shorts)
-            result: List[VideoEntry] = list(url_shorts)
-            for e in entries:
-                if e in url_shorts:
-                    continue
-                enriched = self.enrich_entry(e)
-                if is_shorts({"webpage_url": enriched.url, "duration": enriched.duration}):
-                    result.append(enriched)
-                    if len(result) >= int(limit):
-                        break
-            return result
-
-        # Regular videos: exclude shorts (by URL and possibly by duration)
-        result_regular: List[VideoEntry] = []
+            # Need more: lazily enrich the rest to detect duration-based shorts; islice
+            # stops the pipeline (and its network calls) once the limit is reached
+            enriched = self._enrich_many(e for e in entries if not _has_shorts_url(e))
+            duration_shorts = (e for e in enriched if is_shorts(_filter_view(e)))
+            return url_shorts + list(islice(duration_shorts, int(limit) - len(url_shorts)))
+
+        # Regular videos: exclude shorts (by URL and possibly by duration). Entries with a
+        # shorts URL are rejected without enrichment; the rest are enriched one at a time
+        candidates = self._enrich_many(entries, skip=_has_shorts_url)
+        regular = (e for e in candidates if is_regular(_filter_view(e)))
         if limit is None:
-            # No limit: enrich as needed to correctly exclude duration-based shorts
-            for e in entries:
-                base_is_short = "/shorts/" in (e.url or e.webpage_url or "").lower()
-                enriched = e if base_is_short else self.enrich_entry(e)
-                if is_regular({"webpage_url": enriched.url, "duration": enriched.duration}):
-                    result_regular.append(enriched)
-            return result_regular
-        else:
-            for e in entries:
-                if len(result_regular) >= int(limit):
-                    break
-                base_is_short = "/shorts/" in (e.url or e.webpage_url or "").lower()
-                enriched = e if base_is_short else self.enrich_entry(e)
-                if is_regular({"webpage_url": enriched.url, "duration": enriched.duration}):
-                    result_regular.append(enriched)
-            return result_regular
+            return list(regular)
+        return list(islice(regular, max(0, int(limit))))
 
     def _map_error(self, exc: Exception) -> DownloadError:
         msg = str(exc)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import csv
+import json
 import os
+import re
+from functools import lru_cache
+from time import localtime, monotonic, strftime
 from typing import Optional, Callable, List, Dict, Any
 
-from PySide6.QtCore import Qt, QObject, Signal, QThread, QSettings
-from PySide6.QtGui import QIcon, QTextCursor, QKeySequence, QFontDatabase, QShortcut, QTextOption
+from PySide6.QtCore import Qt, QObject, Signal, QThread, QSettings, QTimer, QSortFilterProxyModel, QThreadPool
+from PySide6.QtGui import QIcon, QTextCursor, QKeySequence, QFontDatabase, QShortcut, QTextOption, QStandardItemModel
 from PySide6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
@@ -33,6 +39,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction as GuiAction  # noqa: F401 (not used directly; retained for compatibility)
 
 from ..core.selector import build_format_selector
+from ..core.url_parser import SHORTS_URL_PREFIX, parse_input
 from ..core.filters import is_shorts, is_regular
 from ..core.exporter import download_best_thumbnail, export_tags
 from ..utils.text_utils import make_safe_filename
@@ -41,6 +48,49 @@ from ..download.ytdlp_wrapper import YtDlpWrapper
 from ..download.queue import DownloadManager
 from ..utils.config import get_default_download_dir
 from ..utils.i18n import tr, set_language, get_language
+from .widgets import LogView, SaveLogTask
+
+
+_SETTINGS_GROUP = "download"
+
+# Error code -> short user-facing title for the error banner
+_FRIENDLY_ERRORS: Dict[str, str] = {
+    "PRIVATE": "Video riêng tư/đã xoá.",
+    "GEO_BLOCK": "Nội dung bị giới hạn khu vực.",
+    "AGE_GATE": "Yêu cầu xác nhận tuổi.",
+    "AUTH_REQUIRED": "YouTube yêu cầu xác thực hoặc lỗi cookies.",
+    "CONTENT_UNAVAILABLE": "Nội dung không khả dụng.",
+    "VIDEO_UNAVAILABLE": "Video không khả dụng.",
+    "NETWORK": "Sự cố mạng hoặc máy chủ.",
+    "FFMPEG_MISSING": "Thiếu ffmpeg/ffprobe.",
+    "NO_SPACE": "Ổ đĩa hết dung lượng.",
+    "UNKNOWN": "Lỗi không xác định.",
+}
+_FOLDER_CHECK_TTL = 2.0
+
+
+@lru_cache(maxsize=32)
+def _folder_writable(folder: str, _bucket: int) -> bool:
+    # _bucket is a monotonic-time slot so cached results expire after _FOLDER_CHECK_TTL seconds
+    return os.path.isdir(folder) and os.access(folder, os.W_OK)
+
+
+def _entry_dict(e: Any) -> Dict[str, Any]:
+    # Prefer the original yt-dlp payload; fall back to the fields we already have
+    return e.raw if e.raw else {"id": e.id, "title": e.title, "tags": e.tags or []}
+
+
+def classify_url(url: str) -> tuple[str, str]:
+    # UI view of url_parser.parse_input: same shapes, but shorts get their own kind
+    s = (url or "").strip()
+    if not s:
+        return "", ""
+    parsed = parse_input(s)
+    if parsed is None:
+        return "", s
+    if parsed.canonical_url.startswith(SHORTS_URL_PREFIX):
+        return "SHORTS", parsed.canonical_url
+    return parsed.kind.value, parsed.canonical_url
 
 
 class ProgressSignal(QObject):
@@ -70,6 +120,7 @@ class DownloadThread(QThread):
         self.stop_after_current: bool = False
         self.total_count: int = 0
         self.completed_items: int = 0
+        self._last_overall_pct: int = -1
 
     def _on_progress(self, ev: Dict[str, Any]) -> None:
         self.signals.progress.emit(ev)
@@ -112,15 +163,11 @@ class DownloadThread(QThread):
                 os.makedirs(self.outdir, exist_ok=True)
                 for e in entries:
                     try:
-                        path = download_best_thumbnail(e.id, e.raw.get("thumbnails") if e.raw else None)
+                        # Write straight into the output folder; no temp file + rename
+                        dest = os.path.join(self.outdir, f"thumbnail_{make_safe_filename(e.title or e.id)}.jpg")
+                        path = download_best_thumbnail(e.id, e.raw.get("thumbnails") if e.raw else None, dest_path=dest)
                         if path:
-                            safe_title = make_safe_filename(e.title or e.id)
-                            dest = os.path.join(self.outdir, f"thumbnail_{safe_title}.jpg")
-                            try:
-                                os.replace(path, dest)
-                                self.signals.message.emit(f"Đã tải thumbnail: {dest}")
-                            except Exception:
-                                pass
+                            self.signals.message.emit(f"Đã tải thumbnail: {dest}")
                     except Exception as ex:
                         self.signals.message.emit(f"Lỗi tải thumbnail cho {e.id}: {ex}")
 
@@ -188,8 +235,11 @@ class DownloadThread(QThread):
                     # update overall after each item finishes
                     self.completed_items += 1
                     if self.total_count:
-                        overall_pct = int(self.completed_items * 100 / self.total_count)
-                        self.signals.progress.emit({"event": "overall", "overall_percent": overall_pct})
+                        overall_pct = (self.completed_items * 100) // self.total_count
+                        # Skip cross-thread emits that would not move the bar
+                        if overall_pct != self._last_overall_pct:
+                            self._last_overall_pct = overall_pct
+                            self.signals.progress.emit({"event": "overall", "overall_percent": overall_pct})
                     if self.subtitles_only:
                         try:
                             after = set(name for name in os.listdir(self.outdir) if name.lower().endswith((".srt", ".vtt")))
@@ -222,7 +272,7 @@ class DownloadThread(QThread):
 
             if self.export_tags_flag:
                 try:
-                    export_tags((e.raw or {"id": e.id, "title": e.title, "tags": e.raw.get("tags") if e.raw else []} for e in entries), self.outdir)
+                    export_tags(map(_entry_dict, entries), self.outdir)
                     self.signals.message.emit("Đã xuất tags thành công")
                 except Exception as ex:
                     self.signals.error.emit(f"Lỗi xuất tags: {ex}")
@@ -245,6 +295,8 @@ class DownloadThread(QThread):
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
+        # Suspend repaints while the widget tree is built; children inherit this
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(tr("app.title"))
         try:
             icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "assets", "icon.png")
@@ -254,6 +306,8 @@ class MainWindow(QMainWindow):
 
         self.worker: Optional[DownloadThread] = None
         self._state: str = "idle"
+        # Last (stripped link text, link count) seen by _detect_url_light
+        self._url_cache: tuple[str, int] = ("", 0)
 
         central = QWidget(self)
         root = QVBoxLayout(central)
@@ -390,10 +444,8 @@ class MainWindow(QMainWindow):
         self.log_search.setVisible(False)
         self.log_search.returnPressed.connect(self._find_next)
 
-        self.log = QPlainTextEdit()
-        self.log.setReadOnly(True)
+        self.log = LogView()
         self.log.setMinimumHeight(160)
-        self.log.setWordWrapMode(QTextOption.NoWrap)
         self.log.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
         self.log.setContextMenuPolicy(Qt.CustomContextMenu)
         self.log.customContextMenuRequested.connect(self._log_context_menu)
@@ -402,11 +454,11 @@ class MainWindow(QMainWindow):
         self.shortcut_find = QShortcut(QKeySequence.Find, self)
         self.shortcut_find.activated.connect(self._toggle_search)
         # App shortcuts
-        self.shortcut_start = QShortcut(QKeySequence("Ctrl+S"), self)
+        self.shortcut_start = QShortcut(QKeySequence(Qt.CTRL | Qt.Key_S), self)
         self.shortcut_start.activated.connect(self._start)
-        self.shortcut_pause = QShortcut(QKeySequence("Space"), self)
+        self.shortcut_pause = QShortcut(QKeySequence(Qt.Key_Space), self)
         self.shortcut_pause.activated.connect(self._pause)
-        self.shortcut_stop = QShortcut(QKeySequence("Esc"), self)
+        self.shortcut_stop = QShortcut(QKeySequence(Qt.Key_Escape), self)
         self.shortcut_stop.activated.connect(self._cancel)
 
         root.addWidget(self.input_group)
@@ -481,8 +533,12 @@ class MainWindow(QMainWindow):
         self.btn_paste.clicked.connect(self._paste_from_clipboard)
         self.btn_detect.clicked.connect(self._detect_url)
         self.btn_clear.clicked.connect(self._clear_links)
-        self.url_edit.textChanged.connect(self._detect_url_light)
-        self.url_edit.textChanged.connect(lambda: self._validate_inputs(True))
+        # Coalesce keystrokes/pastes into a single detect + validate pass
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(75)
+        self._validate_timer.timeout.connect(self._do_validate_and_detect)
+        self.url_edit.textChanged.connect(lambda: self._validate_timer.start())
 
         # Error actions
         self.err_hide_btn.clicked.connect(self.hide_error)
@@ -490,8 +546,10 @@ class MainWindow(QMainWindow):
 
         # Settings then menu (order matters)
         self.settings = QSettings("yt", "allinone")
+        self._last_saved_settings: Dict[str, Any] = {}
         self._load_settings()
         self._setup_menu()
+        self.setUpdatesEnabled(True)
         self._apply_i18n()
 
     def _row(self, widgets: List[QWidget]) -> QWidget:  # type: ignore[name-defined]
@@ -517,13 +575,14 @@ class MainWindow(QMainWindow):
         outdir = self.out_edit.text().strip()
         if not self._validate_inputs(False):
             return
-        quality = self.quality_combo.currentText()
-        only_audio = self.chk_audio.isChecked()
+        opts = self.read_options()
+        quality = opts["quality"]
+        only_audio = opts["audioOnly"]
         only_shorts = self.chk_only_shorts.isChecked()
         only_regular = self.chk_only_regular.isChecked()
-        limit = self.spin_limit.value()
-        thumb = self.chk_thumb.isChecked()
-        export_tags_flag = self.chk_tags.isChecked()
+        limit = opts["limit"]
+        thumb = opts["thumb"]
+        export_tags_flag = opts["tags"]
         safe_mode = self.chk_safe.isChecked()
         user_agent = self.ua_edit.text().strip()
         
@@ -531,11 +590,11 @@ class MainWindow(QMainWindow):
         cookie_browser = self.cookie_combo.currentText()
         cookies_from_browser = None if cookie_browser == "Không dùng" else cookie_browser.lower()
 
-        # Save settings
-        self._save_settings()
+        # Save settings (reuse the values read above)
+        self._save_settings(opts=opts, cookie_text=cookie_browser)
 
         urls = self._normalize_urls(self._parse_urls(url))
-        self.worker = DownloadThread(urls, outdir, quality, only_audio, only_shorts, only_regular, limit, thumb, export_tags_flag, cookies_from_browser, subtitles_only=self.chk_subs.isChecked())
+        self.worker = DownloadThread(urls, outdir, quality, only_audio, only_shorts, only_regular, limit, thumb, export_tags_flag, cookies_from_browser, subtitles_only=opts["subtitles"])
         self.worker.signals.progress.connect(self._on_progress)
         self.worker.signals.message.connect(self._append_log)
         self.worker.signals.error.connect(self._on_error)
@@ -599,45 +658,96 @@ class MainWindow(QMainWindow):
 
     # --- Settings persistence ---
     def _load_settings(self) -> None:
-        self.url_edit.setPlainText(self.settings.value("lastLink", "", type=str))
-        out = self.settings.value("lastOutputDir", "", type=str)
+        # Older builds stored these keys at the root; read them from there until the first save
+        grouped = _SETTINGS_GROUP in self.settings.childGroups()
+        if grouped:
+            self.settings.beginGroup(_SETTINGS_GROUP)
+        try:
+            stored = self._read_settings()
+        finally:
+            if grouped:
+                self.settings.endGroup()
+        # What the group already holds counts as saved, so a no-op close writes nothing.
+        # Legacy root keys are left out: the first save must migrate all of them.
+        if grouped:
+            self._last_saved_settings = stored
+        self._sync_quality_enable()
+
+    def _read_settings(self) -> Dict[str, Any]:
+        """Apply stored settings to the widgets; return the keys actually present, as read."""
+        s = self.settings
+        values: Dict[str, Any] = {
+            "lastLink": s.value("lastLink", "", type=str),
+            "lastOutputDir": s.value("lastOutputDir", "", type=str),
+            "lastQuality": s.value("lastQuality", "best", type=str),
+            "lastCookie": s.value("lastCookie", "Firefox", type=str),
+            "lastFilterType": s.value("lastFilterType", "all", type=str),
+            "lastLimit": s.value("lastLimit", 10, type=int),
+            "optThumb": s.value("optThumb", False, type=bool),
+            "optSubs": s.value("optSubs", False, type=bool),
+            "optTags": s.value("optTags", False, type=bool),
+            "optAudioOnly": s.value("optAudioOnly", False, type=bool),
+            "optSafe": s.value("optSafe", True, type=bool),
+            "optUserAgent": s.value(
+                "optUserAgent",
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:142.0) Gecko/20100101 Firefox/142.0",
+                type=str,
+            ),
+        }
+
+        self.url_edit.setPlainText(values["lastLink"])
+        out = values["lastOutputDir"]
         if out:
             self.out_edit.setText(out)
             if not os.path.isdir(out):
                 self.out_edit.setToolTip("Thư mục không tồn tại. Hãy chọn thư mục hợp lệ.")
-        q = self.settings.value("lastQuality", "best", type=str)
-        idx = max(0, self.quality_combo.findText(q))
-        self.quality_combo.setCurrentIndex(idx)
-        cookie = self.settings.value("lastCookie", "Firefox", type=str)
-        idx = max(0, self.cookie_combo.findText(cookie))
-        self.cookie_combo.setCurrentIndex(idx)
-        ftype = self.settings.value("lastFilterType", "all", type=str)
+        self.quality_combo.setCurrentIndex(max(0, self.quality_combo.findText(values["lastQuality"])))
+        self.cookie_combo.setCurrentIndex(max(0, self.cookie_combo.findText(values["lastCookie"])))
+        ftype = values["lastFilterType"]
         self.chk_only_shorts.setChecked(ftype == "shorts")
         self.chk_only_regular.setChecked(ftype == "regular")
-        self.spin_limit.setValue(self.settings.value("lastLimit", 10, type=int))
-        self.chk_thumb.setChecked(self.settings.value("optThumb", False, type=bool))
-        self.chk_subs.setChecked(self.settings.value("optSubs", False, type=bool))
-        self.chk_tags.setChecked(self.settings.value("optTags", False, type=bool))
-        self.chk_audio.setChecked(self.settings.value("optAudioOnly", False, type=bool))
+        self.spin_limit.setValue(values["lastLimit"])
+        self.chk_thumb.setChecked(values["optThumb"])
+        self.chk_subs.setChecked(values["optSubs"])
+        self.chk_tags.setChecked(values["optTags"])
+        self.chk_audio.setChecked(values["optAudioOnly"])
         # Load safe mode và user agent settings (mặc định đã được set ở trên)
-        self.chk_safe.setChecked(self.settings.value("optSafe", True, type=bool))
-        self.ua_edit.setText(self.settings.value("optUserAgent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:142.0) Gecko/20100101 Firefox/142.0", type=str))
-        self._sync_quality_enable()
-
-    def _save_settings(self) -> None:
-        opts = self.read_options()
-        self.settings.setValue("lastLink", self.url_edit.toPlainText())
-        self.settings.setValue("lastOutputDir", self.out_edit.text())
-        self.settings.setValue("lastQuality", opts["quality"])
-        self.settings.setValue("lastCookie", self.cookie_combo.currentText())
-        self.settings.setValue("lastFilterType", opts["filterType"])
-        self.settings.setValue("lastLimit", opts["limit"])
-        self.settings.setValue("optThumb", opts["thumb"])
-        self.settings.setValue("optSubs", opts["subtitles"])
-        self.settings.setValue("optTags", opts["tags"])
-        self.settings.setValue("optAudioOnly", opts["audioOnly"])
-        self.settings.setValue("optSafe", self.chk_safe.isChecked())
-        self.settings.setValue("optUserAgent", self.ua_edit.text())
+        self.chk_safe.setChecked(values["optSafe"])
+        self.ua_edit.setText(values["optUserAgent"])
+        # Defaults stand in for missing keys; only report what is really stored
+        return {k: v for k, v in values.items() if s.contains(k)}
+
+    def _save_settings(self, opts: Optional[Dict[str, Any]] = None, cookie_text: Optional[str] = None) -> None:
+        if opts is None:
+            opts = self.read_options()
+        if cookie_text is None:
+            cookie_text = self.cookie_combo.currentText()
+        values: Dict[str, Any] = {
+            "lastLink": self.url_edit.toPlainText(),
+            "lastOutputDir": self.out_edit.text(),
+            "lastQuality": opts["quality"],
+            "lastCookie": cookie_text,
+            "lastFilterType": opts["filterType"],
+            "lastLimit": opts["limit"],
+            "optThumb": opts["thumb"],
+            "optSubs": opts["subtitles"],
+            "optTags": opts["tags"],
+            "optAudioOnly": opts["audioOnly"],
+            "optSafe": self.chk_safe.isChecked(),
+            "optUserAgent": self.ua_edit.text(),
+        }
+        # Only write what changed since the last save, then flush once
+        changed = {k: v for k, v in values.items() if self._last_saved_settings.get(k) != v}
+        if not changed:
+            return
+        self.settings.beginGroup(_SETTINGS_GROUP)
+        try:
+            for key, value in changed.items():
+                self.settings.setValue(key, value)
+        finally:
+            self.settings.endGroup()
+        self.settings.sync()
+        self._last_saved_settings.update(changed)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         try:
@@ -698,6 +808,10 @@ class MainWindow(QMainWindow):
         self._validate_inputs(True)
 
     # --- Validation ---
+    def _do_validate_and_detect(self) -> None:
+        self._detect_url_light()
+        self._validate_inputs(True)
+
     def _validate_inputs(self, quiet: bool = False) -> bool:
         ok = True
         # Reset
@@ -712,7 +826,6 @@ class MainWindow(QMainWindow):
         folder = self.out_edit.text().strip()
 
         # URL regex
-        import re
         url_ok = False
         patterns = [
             r"^(?:https?://)?youtu\.be/",
@@ -744,7 +857,7 @@ class MainWindow(QMainWindow):
             url_ok = False
 
         # Folder exists and writable
-        if not (os.path.isdir(folder) and os.access(folder, os.W_OK)):
+        if not _folder_writable(folder, int(monotonic() // _FOLDER_CHECK_TTL)):
             self.out_edit.setProperty("error", True)
             self.out_edit.style().unpolish(self.out_edit)
             self.out_edit.style().polish(self.out_edit)
@@ -779,9 +892,7 @@ class MainWindow(QMainWindow):
         self.set_state("idle")
 
     def _append_log(self, text: str) -> None:
-        from datetime import datetime
-
-        ts = datetime.now().strftime("%H:%M:%S")
+        ts = strftime("%H:%M:%S", localtime())
         self.log.appendPlainText(f"{ts} {text}")
 
     def set_state(self, state: str) -> None:
@@ -845,8 +956,18 @@ class MainWindow(QMainWindow):
         elif action == act_save:
             path, _ = QFileDialog.getSaveFileName(self, "Lưu nhật ký", "log.txt", "Text Files (*.txt)")
             if path:
-                with open(path, "w", encoding="utf-8") as fh:
-                    fh.write(self.log.toPlainText())
+                # Snapshot the lines here (the model keeps changing), write them on the pool
+                task = SaveLogTask(path, list(self.log.log_model().lines()))
+                task.signals.finished.connect(lambda p: self._append_log(f"Đã lưu nhật ký: {p}"))
+                task.signals.error.connect(self._on_log_save_error)
+                # The pool deletes the task after run(); keep its signals object alive
+                # until the queued signals have been delivered
+                self._save_log_signals = task.signals
+                QThreadPool.globalInstance().start(task)
+
+    def _on_log_save_error(self, msg: str) -> None:
+        self._append_log(f"[LỖI] {msg}")
+        self.show_error("UNKNOWN", msg, "")
 
     def _toggle_search(self) -> None:
         visible = not self.log_search.isVisible()
@@ -858,28 +979,12 @@ class MainWindow(QMainWindow):
         pattern = self.log_search.text().strip()
         if not pattern:
             return
-        if not self.log.find(pattern):
-            # wrap to top and search again
-            cursor = self.log.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            self.log.setTextCursor(cursor)
-            self.log.find(pattern)
+        # LogView.find wraps to the top on its own
+        self.log.find(pattern)
 
     # --- Error banner helpers ---
     def show_error(self, code: str, message: str, hint: str) -> None:
-        friendly = {
-            "PRIVATE": "Video riêng tư/đã xoá.",
-            "GEO_BLOCK": "Nội dung bị giới hạn khu vực.",
-            "AGE_GATE": "Yêu cầu xác nhận tuổi.",
-            "AUTH_REQUIRED": "YouTube yêu cầu xác thực hoặc lỗi cookies.",
-            "CONTENT_UNAVAILABLE": "Nội dung không khả dụng.",
-            "VIDEO_UNAVAILABLE": "Video không khả dụng.",
-            "NETWORK": "Sự cố mạng hoặc máy chủ.",
-            "FFMPEG_MISSING": "Thiếu ffmpeg/ffprobe.",
-            "NO_SPACE": "Ổ đĩa hết dung lượng.",
-            "UNKNOWN": "Lỗi không xác định.",
-        }
-        title = friendly.get(code, "Lỗi")
+        title = _FRIENDLY_ERRORS.get(code, "Lỗi")
         text = f"[{code}] {title} {message}".strip()
         self.err_msg.setText(text)
         self.error_banner.setVisible(True)
@@ -894,8 +999,6 @@ class MainWindow(QMainWindow):
 
     # --- Link helpers ---
     def _paste_from_clipboard(self) -> None:
-        from PySide6.QtWidgets import QApplication
-
         cb = QApplication.clipboard()
         text = cb.text() if cb else ""
         pasted = (text or "").strip()
@@ -925,8 +1028,12 @@ class MainWindow(QMainWindow):
 
     def _detect_url_light(self) -> None:
         text = self.url_edit.toPlainText().strip()
-        urls = self._normalize_urls(self._parse_urls(text))
-        count = len(urls)
+        # Re-classify only when the text actually changed since the last run
+        if text == self._url_cache[0]:
+            count = self._url_cache[1]
+        else:
+            count = len(self._normalize_urls(self._parse_urls(text)))
+            self._url_cache = (text, count)
         if count:
             self.kind_chip.setText(f"{count} link")
             self.kind_chip.setVisible(True)
@@ -941,67 +1048,7 @@ class MainWindow(QMainWindow):
             self.kind_chip.setText(f"{len(urls)} link")
             self.kind_chip.setVisible(True)
 
-    # Pure-UI classifier without backend
-    def classify_url(self, url: str) -> tuple[str, str]:
-        import re
-
-        s = (url or "").strip()
-        if not s:
-            return "", ""
-
-        video_id = r"(?P<vid>[A-Za-z0-9_-]{11})"
-        list_id = r"(?P<list>[A-Za-z0-9_-]{10,})"
-        channel_id = r"(?P<chid>UC[A-Za-z0-9_-]{22})"
-        handle = r"(?P<handle>@[A-Za-z0-9._-]{3,30})"
-        yt = r"(?:https?://)?(?:www\.|m\.)?youtube\.com"
-        ytb = r"(?:https?://)?youtu\.be"
-
-        # Bare handle
-        m = re.fullmatch(handle, s)
-        if m:
-            h = m.group("handle").lower()
-            return "HANDLE", f"https://www.youtube.com/{h}/videos"
-
-        # youtu.be short video
-        m = re.match(rf"^{ytb}/{video_id}(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "VIDEO", f"https://www.youtube.com/watch?v={vid}"
-
-        # watch?v
-        m = re.match(rf"^{yt}/watch\?(?:.*&)?v={video_id}(?:[&#/].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "VIDEO", f"https://www.youtube.com/watch?v={vid}"
-
-        # shorts
-        m = re.match(rf"^{yt}/shorts/{video_id}(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "SHORTS", f"https://www.youtube.com/shorts/{vid}"
-
-        # playlist
-        m = re.match(rf"^{yt}/playlist\?(?:.*&)?list={list_id}(?:[&#/].*)?$", s, flags=re.I)
-        if m:
-            pl = m.group("list")
-            return "PLAYLIST", f"https://www.youtube.com/playlist?list={pl}"
-
-        # channel id
-        m = re.match(rf"^{yt}/channel/{channel_id}(?:/.*)?$", s, flags=re.I)
-        if m:
-            chid = m.group("chid")
-            return "CHANNEL", f"https://www.youtube.com/channel/{chid}/videos"
-
-        # @handle url
-        m = re.match(rf"^{yt}/({handle})(?:/videos)?(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            h = m.group("handle").lower()
-            return "HANDLE", f"https://www.youtube.com/{h}/videos"
-
-        return "", s
-
     def _parse_urls(self, text: str) -> List[str]:
-        import re
         parts = re.split(r"[\n,\s]+", text or "")
         return [p.strip() for p in parts if p and p.strip()]
 
@@ -1010,7 +1057,7 @@ class MainWindow(QMainWindow):
         seen = set()
         result: List[str] = []
         for u in urls:
-            _kind, canonical = self.classify_url(u)
+            _kind, canonical = classify_url(u)
             c = canonical or u
             key = c.strip().lower()
             if key in seen:
@@ -1039,6 +1086,37 @@ class MainWindow(QMainWindow):
         dlg.exec()
 
 
+class DryRunProxy(QSortFilterProxyModel):
+    """Title substring + type filter evaluated directly against the source model."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # Only these two columns take part in filtering
+        self._title_col = 1
+        self._type_col = 3
+        self._needle_cf: str = ""
+        self._kind: str = ""
+
+    def set_needle(self, text: str) -> None:
+        # Case-fold once per edit rather than once per row
+        self._needle_cf = (text or "").casefold()
+        self.invalidateFilter()
+
+    def set_kind(self, text: str) -> None:
+        # Combo shows All/Regular/Shorts; the type column holds Video/Shorts
+        self._kind = {"Regular": "Video", "Shorts": "Shorts"}.get(text, "")
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # type: ignore[override]
+        src = self.sourceModel()
+        if self._kind and src.index(source_row, self._type_col, source_parent).data(Qt.DisplayRole) != self._kind:
+            return False
+        if not self._needle_cf:
+            return True
+        title = src.index(source_row, self._title_col, source_parent).data(Qt.DisplayRole) or ""
+        return self._needle_cf in title.casefold()
+
+
 class DryRunDialog(QDialog):
     def __init__(self, parent: QWidget | None, rows: list[dict]) -> None:
         super().__init__(parent)
@@ -1061,25 +1139,21 @@ class DryRunDialog(QDialog):
         layout.addLayout(filter_bar)
 
         # Table
-        from PySide6.QtGui import QStandardItemModel, QStandardItem
-        from PySide6.QtCore import QSortFilterProxyModel
-
         self.model = QStandardItemModel(0, 5, self)
         self.model.setHorizontalHeaderLabels(["#", "Tiêu đề", "Thời lượng", "Loại", "URL"])
-        for idx, r in enumerate(rows, 1):
-            items = [
-                QStandardItem(str(idx)),
-                QStandardItem(str(r.get("title", ""))),
-                QStandardItem(str(r.get("duration", ""))),
-                QStandardItem(str(r.get("type", ""))),
-                QStandardItem(str(r.get("url", ""))),
-            ]
-            self.model.appendRow(items)
-
-        self.proxy = QSortFilterProxyModel(self)
+        # Reserve all rows up front and fill cells before the proxy/view are attached,
+        # so no one is listening to the per-cell change signals yet
+        self.model.insertRows(0, len(rows))
+        model_index, set_data = self.model.index, self.model.setData
+        for i, r in enumerate(rows):
+            set_data(model_index(i, 0), str(i + 1))
+            set_data(model_index(i, 1), str(r.get("title", "")))
+            set_data(model_index(i, 2), str(r.get("duration", "")))
+            set_data(model_index(i, 3), str(r.get("type", "")))
+            set_data(model_index(i, 4), str(r.get("url", "")))
+
+        self.proxy = DryRunProxy(self)
         self.proxy.setSourceModel(self.model)
-        self.proxy.setFilterKeyColumn(1)  # title
-        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
 
         self.table = QTableView(self)
         self.table.setModel(self.proxy)
@@ -1100,137 +1174,42 @@ class DryRunDialog(QDialog):
         layout.addLayout(btn_bar)
 
         # Wire
-        self.search_edit.textChanged.connect(self.proxy.setFilterFixedString)
-        self.cmb_type.currentTextChanged.connect(self._apply_type_filter)
+        self.search_edit.textChanged.connect(self.proxy.set_needle)
+        self.cmb_type.currentTextChanged.connect(self.proxy.set_kind)
         self.btn_close.clicked.connect(self.accept)
         self.btn_csv.clicked.connect(self._export_csv)
         self.btn_json.clicked.connect(self._export_json)
 
-    def _apply_type_filter(self, text: str) -> None:
-        from PySide6.QtCore import QRegularExpression
-
-        if text == "All":
-            self.proxy.setFilterRegularExpression(QRegularExpression(self.search_edit.text(), QRegularExpression.CaseInsensitiveOption))
-            self.proxy.setFilterKeyColumn(1)
-            return
-        # Filter by type via a second proxy or simple manual filter: change filter column to type
-        self.proxy.setFilterKeyColumn(3)  # type column
-        self.proxy.setFilterFixedString("Shorts" if text == "Shorts" else "Video")
+    def _visible_source_rows(self) -> List[int]:
+        # Map each visible proxy row to the source once; cells are then read from the source model
+        proxy = self.proxy
+        return [proxy.mapToSource(proxy.index(r, 0)).row() for r in range(proxy.rowCount())]
 
     def _export_csv(self) -> None:
         path, _ = QFileDialog.getSaveFileName(self, "Lưu CSV", "dryrun.csv", "CSV Files (*.csv)")
         if not path:
             return
-        import csv
 
         with open(path, "w", encoding="utf-8", newline="") as fh:
             writer = csv.writer(fh)
             writer.writerow(["#", "title", "duration", "type", "url"])
-            for r in range(self.proxy.rowCount()):
-                row = [self.proxy.index(r, c).data() for c in range(5)]
-                writer.writerow(row)
+            for sr in self._visible_source_rows():
+                writer.writerow([self.model.item(sr, c).text() for c in range(5)])
 
     def _export_json(self) -> None:
         path, _ = QFileDialog.getSaveFileName(self, "Lưu JSON", "dryrun.json", "JSON Files (*.json)")
         if not path:
             return
-        import json
 
+        item = self.model.item
         rows = []
-        for r in range(self.proxy.rowCount()):
+        for sr in self._visible_source_rows():
             rows.append({
-                "index": self.proxy.index(r, 0).data(),
-                "title": self.proxy.index(r, 1).data(),
-                "duration": self.proxy.index(r, 2).data(),
-                "type": self.proxy.index(r, 3).data(),
-                "url": self.proxy.index(r, 4).data(),
+                "index": item(sr, 0).text(),
+                "title": item(sr, 1).text(),
+                "duration": item(sr, 2).text(),
+                "type": item(sr, 3).text(),
+                "url": item(sr, 4).text(),
             })
         with open(path, "w", encoding="utf-8") as fh:
             json.dump(rows, fh, ensure_ascii=False, indent=2)
-
-    # --- Link helpers ---
-    def _paste_from_clipboard(self) -> None:
-        from PySide6.QtWidgets import QApplication
-
-        cb = QApplication.clipboard()
-        text = cb.text() if cb else ""
-        if text:
-            self.url_edit.setText(text.strip())
-
-    def _detect_url_light(self) -> None:
-        url = self.url_edit.text().strip()
-        kind, canonical = self.classify_url(url)
-        if kind:
-            self.kind_chip.setText(kind)
-            self.kind_chip.setVisible(True)
-        else:
-            self.kind_chip.setVisible(False)
-
-    def _detect_url(self) -> None:
-        url = self.url_edit.text().strip()
-        kind, canonical = self.classify_url(url)
-        if kind:
-            self.kind_chip.setText(kind)
-            self.kind_chip.setVisible(True)
-        if canonical and canonical != url:
-            self.url_edit.setText(canonical)
-
-    # Pure-UI classifier without backend
-    def classify_url(self, url: str) -> tuple[str, str]:
-        import re
-
-        s = (url or "").strip()
-        if not s:
-            return "", ""
-
-        video_id = r"(?P<vid>[A-Za-z0-9_-]{11})"
-        list_id = r"(?P<list>[A-Za-z0-9_-]{10,})"
-        channel_id = r"(?P<chid>UC[A-Za-z0-9_-]{22})"
-        handle = r"(?P<handle>@[A-Za-z0-9._-]{3,30})"
-        yt = r"(?:https?://)?(?:www\.|m\.)?youtube\.com"
-        ytb = r"(?:https?://)?youtu\.be"
-
-        # Bare handle
-        m = re.fullmatch(handle, s)
-        if m:
-            h = m.group("handle").lower()
-            return "HANDLE", f"https://www.youtube.com/{h}/videos"
-
-        # youtu.be short video
-        m = re.match(rf"^{ytb}/{video_id}(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "VIDEO", f"https://www.youtube.com/watch?v={vid}"
-
-        # watch?v
-        m = re.match(rf"^{yt}/watch\?(?:.*&)?v={video_id}(?:[&#/].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "VIDEO", f"https://www.youtube.com/watch?v={vid}"
-
-        # shorts
-        m = re.match(rf"^{yt}/shorts/{video_id}(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            vid = m.group("vid")
-            return "SHORTS", f"https://www.youtube.com/shorts/{vid}"
-
-        # playlist
-        m = re.match(rf"^{yt}/playlist\?(?:.*&)?list={list_id}(?:[&#/].*)?$", s, flags=re.I)
-        if m:
-            pl = m.group("list")
-            return "PLAYLIST", f"https://www.youtube.com/playlist?list={pl}"
-
-        # channel id
-        m = re.match(rf"^{yt}/channel/{channel_id}(?:/.*)?$", s, flags=re.I)
-        if m:
-            chid = m.group("chid")
-            return "CHANNEL", f"https://www.youtube.com/channel/{chid}/videos"
-
-        # @handle url
-        m = re.match(rf"^{yt}/({handle})(?:/videos)?(?:[/?#].*)?$", s, flags=re.I)
-        if m:
-            h = m.group("handle").lower()
-            return "HANDLE", f"https://www.youtube.com/{h}/videos"
-
-        return "", s
-
@@ -1,7 +1,143 @@
-from PySide6.QtWidgets import QWidget
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional
+
+from loguru import logger
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QIODevice,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRunnable,
+    QSaveFile,
+    Qt,
+    Signal,
+)
+from PySide6.QtWidgets import QAbstractItemView, QApplication, QListView, QWidget
+
+LOG_MAX_LINES = 10_000
 
 
 class PlaceholderWidget(QWidget):
     def __init__(self) -> None:
         super().__init__()
 
+
+class LogModel(QAbstractListModel):
+    """Ring buffer of log lines; the oldest line is dropped once ``max_lines`` is reached."""
+
+    def __init__(self, max_lines: int = LOG_MAX_LINES, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(  # type: ignore[override]
+        self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role == Qt.DisplayRole and index.isValid():
+            return self._lines[index.row()]
+        return None
+
+    def append_line(self, line: str) -> None:
+        if len(self._lines) == self._lines.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._lines.popleft()
+            self.endRemoveRows()
+        row = len(self._lines)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._lines.append(line)
+        self.endInsertRows()
+
+    def line(self, row: int) -> str:
+        return self._lines[row]
+
+    def lines(self) -> Iterator[str]:
+        return iter(self._lines)
+
+
+class LogView(QListView):
+    """Read-only log viewer that only paints the visible rows of a LogModel."""
+
+    def __init__(self, parent: Optional[QWidget] = None, max_lines: int = LOG_MAX_LINES) -> None:
+        super().__init__(parent)
+        self._model = LogModel(max_lines, self)
+        self.setModel(self._model)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setWordWrap(False)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+    def log_model(self) -> LogModel:
+        return self._model
+
+    def appendPlainText(self, text: str) -> None:
+        bar = self.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        for line in text.splitlines() or [""]:
+            self._model.append_line(line)
+        if follow:
+            self.scrollToBottom()
+
+    def copy(self) -> None:
+        rows = sorted(idx.row() for idx in self.selectionModel().selectedRows())
+        if rows:
+            QApplication.clipboard().setText("\n".join(self._model.line(r) for r in rows))
+
+    def find(self, pattern: str, wrap: bool = True) -> bool:
+        # Case-insensitive scan starting after the current row, like QPlainTextEdit.find
+        needle = pattern.casefold()
+        count = self._model.rowCount()
+        start = self.currentIndex().row() + 1
+        rows = range(start, count + start) if wrap else range(start, count)
+        for i in rows:
+            row = i % count
+            if needle in self._model.line(row).casefold():
+                idx = self._model.index(row)
+                self.setCurrentIndex(idx)
+                self.scrollTo(idx)
+                return True
+        return False
+
+
+class SaveLogSignals(QObject):
+    finished = Signal(str)  # path written
+    error = Signal(str)
+
+
+class SaveLogTask(QRunnable):
+    """Write a snapshot of log lines to ``path`` atomically, off the GUI thread."""
+
+    def __init__(self, path: str, lines: List[str]) -> None:
+        super().__init__()
+        self.path = path
+        self.lines = lines
+        self.signals = SaveLogSignals()
+
+    def _fail(self, reason: str) -> None:
+        msg = f"Không thể lưu nhật ký {self.path}: {reason}"
+        logger.error(msg)
+        self.signals.error.emit(msg)
+
+    def run(self) -> None:  # type: ignore[override]
+        out = QSaveFile(self.path)
+        if not out.open(QIODevice.WriteOnly):
+            self._fail(out.errorString())
+            return
+        # One line at a time so peak memory stays at roughly one encoded line
+        for line in self.lines:
+            data = f"{line}\n".encode("utf-8")
+            if out.write(data) != len(data):
+                reason = out.errorString()
+                out.cancelWriting()
+                self._fail(reason)
+                return
+        # QSaveFile only replaces the target once commit() succeeds
+        if not out.commit():
+            self._fail(out.errorString())
+            return
+        self.signals.finished.emit(self.path)
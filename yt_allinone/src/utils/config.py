@@ -1,21 +1,14 @@
-try:
-    # Pydantic v2
-    from pydantic_settings import BaseSettings
-except ImportError:  # pragma: no cover
-    # Fallback for v1 environments
-    from pydantic import BaseSettings  # type: ignore
+import functools
+import os
 
-
-class Settings(BaseSettings):
-    download_dir: str = "downloads"
-
-
-settings = Settings()
+# Fallback when ~/Downloads is unusable. YT_DOWNLOAD_DIR overrides it; DOWNLOAD_DIR is
+# still honoured since that is the variable the old pydantic Settings read.
+DEFAULT_DOWNLOAD_DIR = os.environ.get("YT_DOWNLOAD_DIR") or os.environ.get("DOWNLOAD_DIR") or "downloads"
 
 
+# Home and ~/Downloads don't move while the app runs; call cache_clear() if they ever do
+@functools.lru_cache(maxsize=1)
 def get_default_download_dir() -> str:
-    import os
     home = os.path.expanduser("~")
     candidate = os.path.join(home, "Downloads")
-    return candidate if os.path.isdir(candidate) or not os.path.exists(candidate) else settings.download_dir
-
+    return candidate if os.path.isdir(candidate) or not os.path.exists(candidate) else DEFAULT_DOWNLOAD_DIR
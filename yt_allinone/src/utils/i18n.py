@@ -74,9 +74,14 @@ _STRINGS = {
 }
 
 
+# Table for the current language, rebound by set_language so tr() is a single lookup
+_ACTIVE = _STRINGS["vi"]
+
+
 def set_language(lang: str) -> None:
-    global _LANG
+    global _LANG, _ACTIVE
     _LANG = "en" if lang == "en" else "vi"
+    _ACTIVE = _STRINGS.get(_LANG, _STRINGS["vi"])
 
 
 def get_language() -> str:
@@ -84,6 +89,5 @@ def get_language() -> str:
 
 
 def tr(key: str) -> str:
-    table = _STRINGS.get(_LANG, _STRINGS["vi"])  # default vi
-    return table.get(key, key)
+    return _ACTIVE.get(key, key)
 
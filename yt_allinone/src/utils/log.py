@@ -7,7 +7,6 @@ import logging
 from typing import Any, Dict
 
 from loguru import logger
-from rich.logging import RichHandler
 
 
 def _ensure_logs_dir() -> str:
@@ -16,6 +15,14 @@ def _ensure_logs_dir() -> str:
     return logs_dir
 
 
+def _console_attached() -> bool:
+    stream = sys.stderr
+    try:
+        return stream is not None and stream.isatty()
+    except Exception:
+        return False
+
+
 def setup_logging(level: str = "INFO") -> None:
     logger.remove()
 
@@ -27,6 +34,7 @@ def setup_logging(level: str = "INFO") -> None:
         file_path,
         rotation="10 MB",
         retention=5,
+        compression="gz",
         enqueue=True,
         encoding="utf-8",
         level=level,
@@ -35,6 +43,13 @@ def setup_logging(level: str = "INFO") -> None:
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
     )
 
+    # Pretty console output only makes sense with a terminal attached; headless
+    # and test runs skip the loguru -> stdlib -> Rich bridge entirely
+    if not _console_attached():
+        return
+
+    from rich.logging import RichHandler
+
     # Stdlib logging with RichHandler for pretty console logs
     root_logger = logging.getLogger("yttool")
     root_logger.handlers = []
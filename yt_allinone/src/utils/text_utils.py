@@ -4,6 +4,15 @@
 import re
 from typing import Optional
 
+# One pass over ANSI escape sequences and bare color codes like [0;31m / [0m
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\[0;\d+m|\[\d+m')
+_WS_RE = re.compile(r'\s+')
+
+# str.translate tables: drop C0/C1 control characters; for filenames also map
+# reserved characters to underscore
+_CTRL_DEL = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)], None)
+_FILENAME_TABLE = {**_CTRL_DEL, **{ord(c): '_' for c in '<>:"/\\|?*'}}
+
 
 def clean_ansi_codes(text: str) -> str:
     """
@@ -17,18 +26,8 @@ def clean_ansi_codes(text: str) -> str:
     """
     if not text:
         return text
-    
-    # Remove standard ANSI escape sequences
-    text = re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', text)
-    
-    # Remove common color codes like [0;31m, [0m, etc.
-    text = re.sub(r'\[0;\d+m', '', text)
-    text = re.sub(r'\[\d+m', '', text)
-    
-    # Remove any remaining control characters
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-    
-    return text.strip()
+
+    return _ANSI_RE.sub('', text).translate(_CTRL_DEL).strip()
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -83,14 +82,11 @@ def make_safe_filename(text: str, max_length: int = 200) -> str:
     # Remove ANSI (reuse cleaner for safety), then strip
     cleaned = clean_ansi_codes(text).strip()
 
-    # Replace reserved characters with underscore
-    cleaned = re.sub(r'[<>:\\"/\\|\?\*]', '_', cleaned)
-
-    # Remove remaining control characters
-    cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned)
+    # Replace reserved characters with underscore, drop any control characters
+    cleaned = cleaned.translate(_FILENAME_TABLE)
 
     # Collapse whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
 
     # Trim
     cleaned = cleaned.strip(' .')
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Dict, Optional, Union
+
+import pytest
+
+from ..src.core.filters import is_shorts
+from ..src.core.url_parser import parse_input
+from ..src.download.ytdlp_wrapper import YtDlpWrapper
+
+Info = Union[Dict[str, Any], Callable[[str], Dict[str, Any]]]
+
+
+class FakeYDL:
+    """Stand-in for yt_dlp.YoutubeDL. ``info`` is returned as-is, or called with the URL if callable."""
+
+    def __init__(self, info: Info) -> None:
+        self._info = info
+
+    def __enter__(self) -> "FakeYDL":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    def extract_info(self, url: str, download: bool = False) -> Dict[str, Any]:
+        return self._info(url) if callable(self._info) else self._info
+
+
+@pytest.fixture
+def make_wrapper() -> Callable[..., YtDlpWrapper]:
+    """Build a YtDlpWrapper whose YoutubeDL factory returns FakeYDL instances.
+
+    Flat listings (extract_flat=True) get ``info``; other calls get ``enrich`` when given,
+    otherwise ``info`` as well.
+    """
+
+    def build(info: Info, enrich: Optional[Info] = None) -> YtDlpWrapper:
+        flat = FakeYDL(info)
+        other = FakeYDL(enrich) if enrich is not None else flat
+        return YtDlpWrapper(
+            ydl_factory=lambda params=None: flat if (params or {}).get("extract_flat") else other
+        )
+
+    return build
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _warm() -> None:
+    # Compile the parser/filter regexes once up front so the first test to touch
+    # them doesn't carry that cost
+    parse_input("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    is_shorts("https://www.youtube.com/shorts/aaa111bbb22")
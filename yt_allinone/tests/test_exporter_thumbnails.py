@@ -52,3 +52,14 @@ def test_thumbnail_all_fail_returns_none() -> None:  # type: ignore[no-untyped-d
     path = download_best_thumbnail(vid, [])
     assert path is None
 
+
+@responses.activate
+def test_thumbnail_writes_to_dest_path(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    vid = "dst123dst45"
+    base = f"https://i.ytimg.com/vi/{vid}"
+    responses.add(responses.GET, f"{base}/maxresdefault.jpg", body=b"maxres", status=200)
+
+    dest = tmp_path / "thumbnail_x.jpg"
+    path = download_best_thumbnail(vid, [], dest_path=str(dest))
+    assert path == str(dest)
+    assert dest.read_bytes() == b"maxres"
@@ -1,4 +1,4 @@
-from ..src.core.filters import is_shorts, is_regular, apply_filters
+from ..src.core.filters import is_shorts, is_regular, apply_filters, partition
 
 
 def test_is_shorts_by_url() -> None:
@@ -29,4 +29,15 @@ def test_playlist_mixed_short_and_regular() -> None:
 
     assert len(shorts) == 2
     assert len(regular) == 2
+    assert partition(playlist) == (shorts, regular)
 
+
+def test_apply_filters_limit_stops_early() -> None:
+    seen = []
+
+    def pred(x: int) -> bool:
+        seen.append(x)
+        return x % 2 == 0
+
+    assert apply_filters(range(100), pred, limit=2) == [0, 2]
+    assert seen == [0, 1, 2]
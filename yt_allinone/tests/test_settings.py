@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+# No display on CI; must be set before Qt creates the application
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSettings  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from ..src.ui import main_window  # noqa: E402
+from ..src.ui.main_window import MainWindow  # noqa: E402
+
+_STORED = {"lastLink": "https://youtu.be/dQw4w9WgXcQ", "lastLimit": 3, "optThumb": True}
+
+
+class _CountingSettings(QSettings):
+    """INI-backed QSettings that records every setValue call made through Python."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, QSettings.IniFormat)
+        self.writes: List[Tuple[str, Any]] = []
+
+    def setValue(self, key: str, value: Any) -> None:  # type: ignore[override]
+        self.writes.append((key, value))
+        super().setValue(key, value)
+
+
+@pytest.fixture
+def ini_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    # MainWindow builds QSettings("yt", "allinone"); route it to an INI file under tmp_path
+    QApplication.instance() or QApplication([])
+    path = str(tmp_path / "allinone.ini")
+    monkeypatch.setattr(main_window, "QSettings", lambda *args: _CountingSettings(path))
+    return path
+
+
+def test_noop_save_after_grouped_load_writes_nothing(ini_path: str) -> None:
+    seed = QSettings(ini_path, QSettings.IniFormat)
+    seed.beginGroup("download")
+    for key, value in _STORED.items():
+        seed.setValue(key, value)
+    seed.endGroup()
+    seed.sync()
+
+    window = MainWindow()
+    writes = window.settings.writes
+    assert window.spin_limit.value() == 3
+    window._save_settings()
+    # Keys missing from the group are still written once
+    assert {k for k, _ in writes}.isdisjoint(_STORED)
+
+    writes.clear()
+    window._save_settings()
+    assert writes == []
+
+
+def test_first_save_after_legacy_load_migrates_everything(ini_path: str) -> None:
+    seed = QSettings(ini_path, QSettings.IniFormat)
+    for key, value in _STORED.items():
+        seed.setValue(key, value)
+    seed.sync()
+
+    window = MainWindow()
+    writes = window.settings.writes
+    assert window.spin_limit.value() == 3
+    window._save_settings()
+    assert {k for k, _ in writes} >= set(_STORED)
+
+    migrated = QSettings(ini_path, QSettings.IniFormat)
+    migrated.beginGroup("download")
+    assert migrated.value("lastLimit", type=int) == 3
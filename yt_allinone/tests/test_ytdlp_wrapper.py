@@ -1,84 +1,48 @@
-from typing import Any, Dict, List
-import types
-import pytest
-
-from ..src.download.ytdlp_wrapper import YtDlpWrapper
-from ..src.core.filters import is_shorts, is_regular
-
-
-class FakeYDL:
-    def __init__(self, params: Dict[str, Any] | None = None) -> None:
-        self.params = params or {}
-        self._info = None
-
-    def __enter__(self) -> "FakeYDL":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        return None
-
-    def set_info(self, info: Dict[str, Any]) -> None:
-        self._info = info
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from ..src.core.filters import is_regular, is_shorts
+from ..src.download.ytdlp_wrapper import _ENRICH_WORKERS, YtDlpWrapper
+
+# Fixed payloads shared by every test; nothing in the wrapper mutates them
+_FLAT_INFO: Dict[str, Any] = {
+    "entries": [
+        {"id": "id1", "title": "t1", "webpage_url": "https://www.youtube.com/watch?v=id1"},
+        {"id": "id2", "title": "t2", "webpage_url": "https://www.youtube.com/shorts/id2"},
+    ]
+}
 
-    def extract_info(self, url: str, download: bool = False) -> Dict[str, Any]:
-        assert self._info is not None, "FakeYDL info not set"
-        return self._info
+_DRY_RUN_FLAT_INFO: Dict[str, Any] = {
+    "entries": [
+        {"id": "id1", "title": "t1", "webpage_url": "https://www.youtube.com/watch?v=id1", "duration": None},
+        {"id": "id2", "title": "t2", "webpage_url": "https://www.youtube.com/shorts/id2"},
+        {"id": "id3", "title": "t3", "webpage_url": "https://www.youtube.com/watch?v=id3", "duration": None},
+    ]
+}
 
+# Enrichment results for id1 and id3, keyed by URL since enrichment runs concurrently
+_ENRICH_INFOS: Dict[str, Dict[str, Any]] = {
+    "https://www.youtube.com/watch?v=id1": {
+        "id": "id1", "duration": 200, "title": "T1", "webpage_url": "https://www.youtube.com/watch?v=id1",
+    },
+    "https://www.youtube.com/watch?v=id3": {
+        "id": "id3", "duration": 50, "title": "T3", "webpage_url": "https://www.youtube.com/watch?v=id3",
+    },
+}
 
-def test_list_entries_flat(monkeypatch: pytest.MonkeyPatch) -> None:
-    wrapper = YtDlpWrapper()
-    fake = FakeYDL()
-    fake.set_info(
-        {
-            "entries": [
-                {"id": "id1", "title": "t1", "webpage_url": "https://www.youtube.com/watch?v=id1"},
-                {"id": "id2", "title": "t2", "webpage_url": "https://www.youtube.com/shorts/id2"},
-            ]
-        }
-    )
 
-    monkeypatch.setattr("yt_allinone.src.download.ytdlp_wrapper.YoutubeDL", lambda params=None: fake)
+def test_list_entries_flat(make_wrapper: Callable[..., YtDlpWrapper]) -> None:
+    wrapper = make_wrapper(_FLAT_INFO)
     entries = wrapper.list_entries("https://youtube.com/playlist?list=PLx", flat=True)
     assert len(entries) == 2
     assert entries[0].id == "id1"
     assert entries[1].url.endswith("/shorts/id2")
 
 
-def test_dry_run_filter_and_limit(monkeypatch: pytest.MonkeyPatch) -> None:
-    wrapper = YtDlpWrapper()
-
-    # First call: flat listing
-    fake_flat = FakeYDL()
-    fake_flat.set_info(
-        {
-            "entries": [
-                {"id": "id1", "title": "t1", "webpage_url": "https://www.youtube.com/watch?v=id1", "duration": None},
-                {"id": "id2", "title": "t2", "webpage_url": "https://www.youtube.com/shorts/id2"},
-                {"id": "id3", "title": "t3", "webpage_url": "https://www.youtube.com/watch?v=id3", "duration": None},
-            ]
-        }
-    )
-
-    # Second call: enrich id1 and id3
-    enrich_infos: List[Dict[str, Any]] = [
-        {"id": "id1", "duration": 200, "title": "T1", "webpage_url": "https://www.youtube.com/watch?v=id1"},
-        {"id": "id3", "duration": 50, "title": "T3", "webpage_url": "https://www.youtube.com/watch?v=id3"},
-    ]
-    calls = {"idx": 0}
-
-    class FakeYDL2(FakeYDL):
-        def extract_info(self, url: str, download: bool = False) -> Dict[str, Any]:
-            i = calls["idx"]
-            calls["idx"] += 1
-            return enrich_infos[i]
-
-    def fake_factory(params=None):
-        # Return flat for first with extract_flat True, then FakeYDL2 for enrich
-        if params and params.get("extract_flat"):
-            return fake_flat
-        return FakeYDL2(params)
-
-    monkeypatch.setattr("yt_allinone.src.download.ytdlp_wrapper.YoutubeDL", fake_factory)
+def test_dry_run_filter_and_limit(make_wrapper: Callable[..., YtDlpWrapper]) -> None:
+    # Flat listing first, then the enrichment payload for the requested URL
+    wrapper = make_wrapper(_DRY_RUN_FLAT_INFO, enrich=_ENRICH_INFOS.__getitem__)
 
     # Only regular videos, limit 1
     out = wrapper.dry_run("https://youtube.com/playlist?list=PLx", filter_fn=is_regular, limit=1)
@@ -90,3 +54,48 @@ def test_dry_run_filter_and_limit(monkeypatch: pytest.MonkeyPatch) -> None:
     assert len(out2) == 1
     assert "/shorts/" in (out2[0].url or "")
 
+
+def test_dry_run_enriches_in_order(make_wrapper: Callable[..., YtDlpWrapper]) -> None:
+    wrapper = make_wrapper(_DRY_RUN_FLAT_INFO, enrich=_ENRICH_INFOS.__getitem__)
+
+    regular = wrapper.dry_run("https://youtube.com/playlist?list=PLx", filter_fn=is_regular, limit=None)
+    assert [(e.id, e.duration) for e in regular] == [("id1", 200)]
+
+    shorts = wrapper.dry_run("https://youtube.com/playlist?list=PLx", filter_fn=is_shorts, limit=5)
+    assert [e.id for e in shorts] == ["id2", "id3"]
+
+
+# More entries than one enrichment batch, none classifiable without enrichment
+_MANY_COUNT = _ENRICH_WORKERS * 2 + 3
+_MANY_FLAT_INFO: Dict[str, Any] = {
+    "entries": [
+        {"id": f"v{i:02d}", "webpage_url": f"https://www.youtube.com/watch?v=v{i:02d}"} for i in range(_MANY_COUNT)
+    ]
+}
+
+
+def test_dry_run_parallel_enrichment_order_and_limit(make_wrapper: Callable[..., YtDlpWrapper]) -> None:
+    calls: List[str] = []
+    lock = threading.Lock()
+
+    def enrich(url: str) -> Dict[str, Any]:
+        vid = url.rsplit("=", 1)[1]
+        idx = int(vid[1:])
+        with lock:
+            calls.append(vid)
+        # Later entries in a batch finish first, so ordering can't come from completion order
+        time.sleep(0.001 * (_ENRICH_WORKERS - idx % _ENRICH_WORKERS))
+        return {"id": vid, "title": vid, "duration": 100 + idx, "webpage_url": url}
+
+    wrapper = make_wrapper(_MANY_FLAT_INFO, enrich=enrich)
+
+    out = wrapper.dry_run("https://youtube.com/playlist?list=PLx", filter_fn=is_regular, limit=None)
+    assert [e.id for e in out] == [f"v{i:02d}" for i in range(_MANY_COUNT)]
+    assert [e.duration for e in out] == [100 + i for i in range(_MANY_COUNT)]
+    assert len(calls) == _MANY_COUNT
+
+    calls.clear()
+    out = wrapper.dry_run("https://youtube.com/playlist?list=PLx", filter_fn=is_regular, limit=1)
+    assert [e.id for e in out] == ["v00"]
+    # Stopping early wastes at most the rest of one batch
+    assert 1 <= len(calls) <= _ENRICH_WORKERS